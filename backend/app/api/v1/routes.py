@@ -1,64 +1,51 @@
+import asyncio
+import hashlib
 import json
+from functools import partial
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-import yfinance as yf
-import pandas as pd
+import anyio.to_thread
+from anyio import CapacityLimiter
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
 import numpy as np
-from sqlalchemy import func, text
+from sqlalchemy import and_, case, func, or_, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from app.db.session import SessionLocal, Base, engine
+from app.api.responses import ORJSONResponse
+from app.core.config import settings
+from app.db.session import SessionLocal, engine
 from app.models.backtest import Backtest
 from app.models.strategy_profile import StrategyProfile
-
-Base.metadata.create_all(bind=engine)
-
-# lightweight guard to add order_index when migrating from earlier schema
-with engine.begin() as conn:
-    if engine.dialect.name == "postgresql":
-        conn.execute(
-            text(
-                "DO $$ BEGIN IF NOT EXISTS (SELECT 1 FROM information_schema.columns "
-                "WHERE table_name='strategy_profiles' AND column_name='order_index') THEN "
-                "ALTER TABLE strategy_profiles ADD COLUMN order_index INTEGER DEFAULT 0; "
-                "END IF; "
-                "IF NOT EXISTS (SELECT 1 FROM information_schema.columns "
-                "WHERE table_name='backtests' AND column_name='strategy_type') THEN "
-                "ALTER TABLE backtests ADD COLUMN strategy_type TEXT DEFAULT 'sma'; "
-                "END IF; "
-                "IF NOT EXISTS (SELECT 1 FROM information_schema.columns "
-                "WHERE table_name='backtests' AND column_name='strategy_params') THEN "
-                "ALTER TABLE backtests ADD COLUMN strategy_params JSONB; "
-                "END IF; "
-                "END $$;"
-            )
-        )
-    else:
-        # SQLite: attempt to add column; ignore if it exists
-        try:
-            conn.execute(text("ALTER TABLE strategy_profiles ADD COLUMN order_index INTEGER DEFAULT 0"))
-        except Exception:
-            pass
-        try:
-            conn.execute(text("ALTER TABLE backtests ADD COLUMN strategy_type TEXT DEFAULT 'sma'"))
-        except Exception:
-            pass
-        try:
-            conn.execute(text("ALTER TABLE backtests ADD COLUMN strategy_params TEXT"))
-        except Exception:
-            pass
+from app.schemas.backtest import BacktestBatchRequest, BacktestConfig
+from app.schemas.strategy_profile import StrategyProfileCreate
+from app.services.backtest import risk_metrics, simulate_trades
+from app.services.indicators import ema, rolling_mean, wilder_rsi
+from app.services.market_data import epoch_seconds, fetch_history, iso_timestamps
 
 router = APIRouter()
 
+# batch compute slots shared by every request, so work abandoned by a timed-out batch still counts
+_batch_limiter = CapacityLimiter(settings.BACKTEST_BATCH_WORKERS)
+
 
 def get_db():
     db = SessionLocal()
     try:
         yield db
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
 
 
+def _columns_to_records(columns: dict[str, list | np.ndarray]) -> list[dict]:
+    keys = list(columns)
+    values = [column.tolist() if isinstance(column, np.ndarray) else column for column in columns.values()]
+    return [dict(zip(keys, row)) for row in zip(*values)]
+
+
 def _deserialize_strategy_params(raw):
     if engine.dialect.name == "sqlite" and isinstance(raw, str):
         try:
@@ -68,6 +55,57 @@ def _deserialize_strategy_params(raw):
     return raw or {}
 
 
+def _serialize_backtest(bt: Backtest) -> dict:
+    return {
+        "id": bt.id,
+        "created_at": bt.created_at.isoformat(),
+        "symbol": bt.symbol,
+        "strategy_type": getattr(bt, "strategy_type", "sma"),
+        "strategy_params": _deserialize_strategy_params(getattr(bt, "strategy_params", {})),
+        "short_window": bt.short_window,
+        "long_window": bt.long_window,
+        "period": bt.period,
+        "interval": bt.interval,
+        "initial_capital": bt.initial_capital,
+        "fee_rate": bt.fee_rate,
+        "metrics": {
+            "sharpe": bt.sharpe,
+            "max_drawdown": bt.max_drawdown,
+            "total_return": bt.total_return,
+            "win_rate": bt.win_rate,
+            "num_trades": bt.num_trades,
+        },
+    }
+
+
+def _serialize_strategy(s: StrategyProfile) -> dict:
+    return {
+        "id": s.id,
+        "created_at": s.created_at.isoformat(),
+        "name": s.name,
+        "symbol": s.symbol,
+        "short_window": s.short_window,
+        "long_window": s.long_window,
+        "period": s.period,
+        "interval": s.interval,
+        "initial_capital": s.initial_capital,
+        "fee_rate": s.fee_rate,
+    }
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """
+    If-None-Match check using weak comparison, so W/ prefixes are ignored on both sides.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    tag = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == tag for candidate in header.split(","))
+
+
 @router.get("/health")
 async def health_check():
     return {"status": "ok"}
@@ -94,13 +132,12 @@ async def demo_prices():
 
 
 @router.get("/prices/{symbol}")
-async def get_prices(symbol: str, period: str = "1mo", interval: str = "1d"):
+async def get_prices(symbol: str, period: str = "1mo", interval: str = "1d") -> ORJSONResponse:
     """
     Fetch historical OHLCV data for a symbol via Yahoo Finance.
     """
     try:
-        ticker = yf.Ticker(symbol)
-        history = ticker.history(period=period, interval=interval)
+        history = await fetch_history(symbol, period, interval)
     except Exception as exc:  # pragma: no cover - simple error passthrough
         raise HTTPException(status_code=500, detail=f"Error fetching data: {exc}") from exc
 
@@ -110,224 +147,134 @@ async def get_prices(symbol: str, period: str = "1mo", interval: str = "1d"):
             detail=f"No data returned for symbol {symbol}. Check the ticker or parameters.",
         )
 
-    history = history.reset_index()
-    ts_col = "Date" if "Date" in history.columns else "Datetime"
-
+    # bars are indexed by timestamp; read it straight off the index instead of reset_index()
+    timestamps = iso_timestamps(history.index)
+    opens, highs, lows, closes = history[["Open", "High", "Low", "Close"]].to_numpy(dtype=np.float64).T.tolist()
+    volumes = history["Volume"].to_numpy(dtype=np.int64).tolist()
     data = [
-        {
-            "timestamp": row[ts_col].isoformat(),
-            "open": float(row["Open"]),
-            "high": float(row["High"]),
-            "low": float(row["Low"]),
-            "close": float(row["Close"]),
-            "volume": int(row["Volume"]),
-        }
-        for _, row in history.iterrows()
+        {"timestamp": ts, "open": o, "high": h, "low": l, "close": c, "volume": v}
+        for ts, o, h, l, c, v in zip(timestamps, opens, highs, lows, closes, volumes)
     ]
 
-    return {
-        "symbol": symbol.upper(),
-        "interval": interval,
-        "period": period,
-        "data": data,
-    }
+    # a Response is sent as-is, skipping jsonable_encoder's walk over every bar
+    return ORJSONResponse(
+        {
+            "symbol": symbol.upper(),
+            "interval": interval,
+            "period": period,
+            "data": data,
+        }
+    )
 
 
-@router.get("/backtest/sma")
-async def sma_crossover_backtest(
-    symbol: str,
-    strategy_type: str = Query("sma"),
-    short_window: int = Query(10, ge=1),
-    long_window: int = Query(20, ge=2),
-    period: str = "3mo",
-    interval: str = "1d",
-    initial_capital: float = Query(10_000, gt=0),
-    fee_rate: float = Query(0.0005, ge=0.0),  # e.g., 5 bps per trade
-    rsi_window: int = Query(14, ge=1),
-    rsi_overbought: float = Query(70, ge=0),
-    rsi_oversold: float = Query(30, ge=0),
-    macd_fast: int = Query(12, ge=1),
-    macd_slow: int = Query(26, ge=2),
-    macd_signal: int = Query(9, ge=1),
-    ema_fast: int = Query(10, ge=1),
-    ema_slow: int = Query(20, ge=2),
-    db: Session = Depends(get_db),
-):
+def _backtest_payload(
+    history,
+    *,
+    symbol_upper: str,
+    strategy_type: str,
+    period: str,
+    interval: str,
+    initial_capital: float,
+    fee_rate: float,
+    response_format: str,
+    short_window: int,
+    long_window: int,
+    rsi_window: int,
+    rsi_overbought: float,
+    rsi_oversold: float,
+    macd_fast: int,
+    macd_slow: int,
+    macd_signal: int,
+    ema_fast: int,
+    ema_slow: int,
+) -> dict:
     """
-    Multi-strategy backtest engine.
-    strategy_type: sma | ema | rsi | macd | buyhold
+    Signals, simulation, metrics and response payload for one fetched history.
+    Pure CPU work with no session, so it runs in worker threads (several at once for batches).
     """
-    symbol_upper = symbol.upper()
-    strategy_type = strategy_type.lower()
-
-    if strategy_type in ["sma", "ema"] and short_window >= long_window and strategy_type == "sma":
-        raise HTTPException(status_code=400, detail="short_window must be less than long_window for SMA.")
-    if strategy_type == "ema" and ema_fast >= ema_slow:
-        raise HTTPException(status_code=400, detail="ema_fast must be less than ema_slow.")
-    if strategy_type == "macd" and macd_fast >= macd_slow:
-        raise HTTPException(status_code=400, detail="macd_fast must be less than macd_slow.")
-
-    try:
-        ticker = yf.Ticker(symbol)
-        history = ticker.history(period=period, interval=interval)
-    except Exception as exc:  # pragma: no cover
-        raise HTTPException(status_code=500, detail=f"Error fetching data: {exc}") from exc
-
-    if history.empty:
-        raise HTTPException(
-            status_code=404,
-            detail=f"No data returned for symbol {symbol}. Check the ticker or parameters.",
-        )
-
-    history = history.reset_index()
-    ts_col = "Date" if "Date" in history.columns else "Datetime"
-    closes = history["Close"].copy()
-
-    # signals and position determination
-    position = pd.Series(0, index=history.index)
-
+    bars = history.index
+    close = np.ascontiguousarray(history["Close"].to_numpy(dtype=np.float64))
+    open_high_low = history[["Open", "High", "Low"]].to_numpy(dtype=np.float64)
+    missing = np.isnan(close)
+    if missing.any():
+        # drop feed gaps up front so indicator NaNs only ever form a warm-up prefix
+        bars = bars[~missing]
+        close = close[~missing]
+        open_high_low = open_high_low[~missing]
+
+    # indicators stay out of the frame; `warmup` is the number of leading bars where one is undefined
     if strategy_type == "sma":
-        history["short_sma"] = closes.rolling(window=short_window).mean()
-        history["long_sma"] = closes.rolling(window=long_window).mean()
-        history.dropna(subset=["short_sma", "long_sma"], inplace=True)
-        position = (history["short_sma"] > history["long_sma"]).astype(int)
+        short_sma = rolling_mean(close, short_window)
+        long_sma = rolling_mean(close, long_window)
+        warmup = long_window - 1
+        position = short_sma > long_sma
     elif strategy_type == "ema":
-        history["ema_fast"] = closes.ewm(span=ema_fast, adjust=False).mean()
-        history["ema_slow"] = closes.ewm(span=ema_slow, adjust=False).mean()
-        history.dropna(subset=["ema_fast", "ema_slow"], inplace=True)
-        position = (history["ema_fast"] > history["ema_slow"]).astype(int)
+        ema_fast_line = ema(close, ema_fast)
+        ema_slow_line = ema(close, ema_slow)
+        warmup = 0
+        position = ema_fast_line > ema_slow_line
     elif strategy_type == "rsi":
-        delta = closes.diff()
-        up = delta.clip(lower=0)
-        down = -1 * delta.clip(upper=0)
-        roll_up = up.rolling(rsi_window).mean()
-        roll_down = down.rolling(rsi_window).mean()
-        rs = roll_up / roll_down.replace(0, np.nan)
-        history["rsi"] = 100 - (100 / (1 + rs))
-        history.dropna(subset=["rsi"], inplace=True)
-        position = (history["rsi"] < rsi_oversold).astype(int)
-        # exit when overbought: set to 0 when rsi > overbought
-        position = position.where(history["rsi"] <= rsi_overbought, 0)
+        rsi = wilder_rsi(close, rsi_window)
+        # NaN through the seed window and until the first losing bar, so it depends on the data
+        defined = ~np.isnan(rsi)
+        warmup = int(defined.argmax()) if defined.any() else close.shape[0]
+        # long while oversold; exit when overbought
+        position = (rsi < rsi_oversold) & (rsi <= rsi_overbought)
     elif strategy_type == "macd":
-        ema_fast_series = closes.ewm(span=macd_fast, adjust=False).mean()
-        ema_slow_series = closes.ewm(span=macd_slow, adjust=False).mean()
-        macd_line = ema_fast_series - ema_slow_series
-        signal_line = macd_line.ewm(span=macd_signal, adjust=False).mean()
-        history["macd"] = macd_line
-        history["signal"] = signal_line
-        history.dropna(subset=["macd", "signal"], inplace=True)
-        position = (history["macd"] > history["signal"]).astype(int)
+        macd_arr = ema(close, macd_fast) - ema(close, macd_slow)
+        signal_arr = ema(macd_arr, macd_signal)
+        warmup = 0
+        position = macd_arr > signal_arr
     elif strategy_type == "buyhold":
-        position = pd.Series(1, index=history.index)
+        warmup = 0
+        position = np.ones(close.shape[0], dtype=bool)
     else:
         raise HTTPException(status_code=400, detail="Unsupported strategy_type.")
 
-    history["position"] = position
-    history["signal"] = history["position"].diff().fillna(0)
-
-    ohlc: list[dict[str, float | int]] = []
-    for _, row in history.iterrows():
-        ohlc.append(
-            {
-                "time": int(pd.Timestamp(row[ts_col]).timestamp()),
-                "open": float(row["Open"]),
-                "high": float(row["High"]),
-                "low": float(row["Low"]),
-                "close": float(row["Close"]),
-            }
-        )
-
-    cash = float(initial_capital)
-    shares = 0
-    entry_price = None
-    entry_shares = 0
-    completed_trades = 0
-    wins = 0
-    equity_curve: list[dict[str, float | str]] = []
-    trades: list[dict[str, float | str]] = []
-
-    for _, row in history.iterrows():
-        price = float(row["Close"])
-        timestamp = row[ts_col].isoformat()
-        signal = row["signal"]
-
-        if signal == 1 and shares == 0:
-            shares = int(cash // price)
-            if shares > 0:
-                cost = shares * price
-                commission = cost * fee_rate
-                cash -= cost + commission
-                entry_price = price
-                entry_shares = shares
-                trades.append(
-                    {
-                        "timestamp": timestamp,
-                        "side": "BUY",
-                        "price": price,
-                        "shares": shares,
-                        "equity_after_trade": round(cash + shares * price, 2),
-                    }
-                )
-        elif signal == -1 and shares > 0:
-            proceeds = shares * price
-            commission = proceeds * fee_rate
-            cash += proceeds - commission
-            trades.append(
-                {
-                    "timestamp": timestamp,
-                    "side": "SELL",
-                    "price": price,
-                    "shares": shares,
-                    "equity_after_trade": round(cash, 2),
-                }
-            )
-            if entry_price is not None and entry_shares:
-                completed_trades += 1
-                if price > entry_price:
-                    wins += 1
-            shares = 0
-            entry_price = None
-            entry_shares = 0
-
-        equity = cash + shares * price
-        equity_curve.append({"timestamp": timestamp, "equity": round(equity, 2)})
-
-    # Close any open position at end for buy/hold; keep as is for others by default
-    if shares > 0:
-        price = float(history.iloc[-1]["Close"])
-        proceeds = shares * price
-        commission = proceeds * fee_rate
-        cash += proceeds - commission
-        trades.append(
-            {
-                "timestamp": history.iloc[-1][ts_col].isoformat(),
-                "side": "SELL",
-                "price": price,
-                "shares": shares,
-                "equity_after_trade": round(cash, 2),
-            }
-        )
-        if entry_price is not None and entry_shares:
-            completed_trades += 1
-            if price > entry_price:
-                wins += 1
-        shares = 0
-        equity_curve[-1]["equity"] = round(cash, 2)
-
-    equity_df = pd.DataFrame(equity_curve).set_index("timestamp")
-    returns = equity_df["equity"].pct_change().dropna()
-
-    if not returns.empty and returns.std() > 0:
-        sharpe = (returns.mean() / returns.std()) * np.sqrt(252)
+    if warmup:
+        # basic slices are views; no mask scan or fancy-index copies
+        bars = bars[warmup:]
+        close = close[warmup:]
+        open_high_low = open_high_low[warmup:]
+        position = position[warmup:]
+    if close.shape[0] == 0:
+        # nothing left to trade once the warm-up is cut; refuse rather than store an empty run
+        raise HTTPException(status_code=400, detail="Not enough bars for the requested indicator windows.")
+    # every branch yields a bool mask; reinterpret it as int8 without copying
+    position = position.view(np.int8)
+    signal = np.zeros_like(position)
+    np.subtract(position[1:], position[:-1], out=signal[1:])
+
+    timestamps = iso_timestamps(bars)
+    bar_times = epoch_seconds(bars)
+
+    # orjson only serializes C-contiguous arrays (close is made contiguous above for the same reason)
+    opens, highs, lows = np.ascontiguousarray(open_high_low.T)
+    ohlc_columns = {"time": bar_times, "open": opens, "high": highs, "low": lows, "close": close}
+
+    result = simulate_trades(close, signal, initial_capital, fee_rate)
+    equity_arr = result.equity
+    # NumPy columns are handed to orjson as-is for soa; records mode converts them once
+    equity_columns = {"timestamp": timestamps, "equity": equity_arr}
+    trade_columns = {
+        "timestamp": [timestamps[i] for i in result.trade_index.tolist()],
+        "side": ["BUY" if side == 1 else "SELL" for side in result.trade_side.tolist()],
+        "price": result.trade_price,
+        "shares": result.trade_shares,
+        "equity_after_trade": result.trade_equity,
+    }
+    if response_format == "soa":
+        ohlc, equity_curve, trades = ohlc_columns, equity_columns, trade_columns
     else:
-        sharpe = 0.0
+        ohlc = _columns_to_records(ohlc_columns)
+        equity_curve, trades = _columns_to_records(equity_columns), _columns_to_records(trade_columns)
+    completed_trades = result.completed_trades
+    wins = result.wins
 
-    rolling_max = equity_df["equity"].cummax()
-    drawdown = (equity_df["equity"] - rolling_max) / rolling_max
-    max_drawdown = float(drawdown.min()) if not drawdown.empty else 0.0
+    sharpe, max_drawdown = risk_metrics(equity_arr)
 
     win_rate = (wins / completed_trades) if completed_trades > 0 else 0.0
-    total_return = (equity_curve[-1]["equity"] / initial_capital) - 1 if equity_curve else 0.0
+    total_return = (float(equity_arr[-1]) / initial_capital) - 1 if equity_arr.size else 0.0
     num_trades = completed_trades
 
     strategy_params = {
@@ -343,31 +290,6 @@ async def sma_crossover_backtest(
         "ema_slow": ema_slow,
     }
 
-    # SQLite JSON fallback: store as string
-    strategy_params_for_db = (
-        json.dumps(strategy_params) if engine.dialect.name == "sqlite" else strategy_params
-    )
-
-    record = Backtest(
-        symbol=symbol_upper,
-        short_window=short_window,
-        long_window=long_window,
-        period=period,
-        interval=interval,
-        initial_capital=initial_capital,
-        fee_rate=fee_rate,
-        strategy_type=strategy_type,
-        strategy_params=strategy_params_for_db,
-        sharpe=round(float(sharpe), 3),
-        max_drawdown=round(max_drawdown, 4),
-        total_return=round(total_return, 4),
-        win_rate=round(win_rate, 3),
-        num_trades=num_trades,
-    )
-    db.add(record)
-    db.commit()
-    db.refresh(record)
-
     return {
         "symbol": symbol_upper,
         "short_window": short_window,
@@ -388,96 +310,232 @@ async def sma_crossover_backtest(
             "total_return": round(total_return, 4),
             "num_trades": num_trades,
         },
-        "id": record.id,
-        "created_at": record.created_at.isoformat(),
     }
 
 
+def _save_backtests(db: Session, payloads: list[dict]) -> None:
+    """
+    Persist and commit finished backtest payloads, stamping each with its id and created_at.
+    """
+    records = []
+    for payload in payloads:
+        strategy_params = payload["strategy_params"]
+        metrics = payload["metrics"]
+        records.append(
+            Backtest(
+                symbol=payload["symbol"],
+                short_window=payload["short_window"],
+                long_window=payload["long_window"],
+                period=payload["period"],
+                interval=payload["interval"],
+                initial_capital=payload["initial_capital"],
+                fee_rate=payload["fee_rate"],
+                strategy_type=payload["strategy_type"],
+                # SQLite JSON fallback: store as string
+                strategy_params=json.dumps(strategy_params) if engine.dialect.name == "sqlite" else strategy_params,
+                sharpe=metrics["sharpe"],
+                max_drawdown=metrics["max_drawdown"],
+                total_return=metrics["total_return"],
+                win_rate=metrics["win_rate"],
+                num_trades=metrics["num_trades"],
+            )
+        )
+    db.add_all(records)
+    # flush assigns id/created_at; read them before commit expires the instances
+    db.flush()
+    for payload, record in zip(payloads, records):
+        payload["id"] = record.id
+        payload["created_at"] = record.created_at.isoformat()
+    # commit here, not in get_db: dependency teardown runs after the response is sent
+    db.commit()
+
+
+def _run_backtest(history, db: Session, **params) -> dict:
+    payload = _backtest_payload(history, **params)
+    _save_backtests(db, [payload])
+    return payload
+
+
+def _check_backtest_params(
+    strategy_type: str, short_window: int, long_window: int, ema_fast: int, ema_slow: int, macd_fast: int, macd_slow: int
+) -> None:
+    if strategy_type in ["sma", "ema"] and short_window >= long_window and strategy_type == "sma":
+        raise HTTPException(status_code=400, detail="short_window must be less than long_window for SMA.")
+    if strategy_type == "ema" and ema_fast >= ema_slow:
+        raise HTTPException(status_code=400, detail="ema_fast must be less than ema_slow.")
+    if strategy_type == "macd" and macd_fast >= macd_slow:
+        raise HTTPException(status_code=400, detail="macd_fast must be less than macd_slow.")
+
+
+async def _fetch_backtest_history(symbol: str, period: str, interval: str):
+    try:
+        history = await fetch_history(symbol, period, interval)
+    except Exception as exc:  # pragma: no cover
+        raise HTTPException(status_code=500, detail=f"Error fetching data: {exc}") from exc
+
+    if history.empty:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No data returned for symbol {symbol}. Check the ticker or parameters.",
+        )
+    return history
+
+
+@router.get("/backtest/sma")
+async def sma_crossover_backtest(
+    symbol: str,
+    strategy_type: str = Query("sma"),
+    short_window: int = Query(10, ge=1),
+    long_window: int = Query(20, ge=2),
+    period: str = "3mo",
+    interval: str = "1d",
+    initial_capital: float = Query(10_000, gt=0),
+    fee_rate: float = Query(0.0005, ge=0.0),  # e.g., 5 bps per trade
+    rsi_window: int = Query(14, ge=1),
+    rsi_overbought: float = Query(70, ge=0),
+    rsi_oversold: float = Query(30, ge=0),
+    macd_fast: int = Query(12, ge=1),
+    macd_slow: int = Query(26, ge=2),
+    macd_signal: int = Query(9, ge=1),
+    ema_fast: int = Query(10, ge=1),
+    ema_slow: int = Query(20, ge=2),
+    response_format: str = Query("aos", alias="format", pattern="^(aos|soa)$"),
+    db: Session = Depends(get_db),
+) -> ORJSONResponse:
+    """
+    Multi-strategy backtest engine.
+    strategy_type: sma | ema | rsi | macd | buyhold
+    format: aos returns ohlc/equity_curve/trades as lists of row objects; soa returns
+    them as objects of parallel column arrays, e.g. {"timestamp": [...], "equity": [...]}.
+    """
+    symbol_upper = symbol.upper()
+    strategy_type = strategy_type.lower()
+
+    _check_backtest_params(strategy_type, short_window, long_window, ema_fast, ema_slow, macd_fast, macd_slow)
+
+    history = await _fetch_backtest_history(symbol, period, interval)
+    payload = await run_in_threadpool(
+        _run_backtest,
+        history,
+        db,
+        symbol_upper=symbol_upper,
+        strategy_type=strategy_type,
+        period=period,
+        interval=interval,
+        initial_capital=initial_capital,
+        fee_rate=fee_rate,
+        response_format=response_format,
+        short_window=short_window,
+        long_window=long_window,
+        rsi_window=rsi_window,
+        rsi_overbought=rsi_overbought,
+        rsi_oversold=rsi_oversold,
+        macd_fast=macd_fast,
+        macd_slow=macd_slow,
+        macd_signal=macd_signal,
+        ema_fast=ema_fast,
+        ema_slow=ema_slow,
+    )
+    # returned as a Response so the NumPy columns skip jsonable_encoder
+    return ORJSONResponse(payload)
+
+
+@router.post("/backtest/batch")
+async def batch_backtest(batch: BacktestBatchRequest, db: Session = Depends(get_db)) -> ORJSONResponse:
+    """
+    Run several backtests (a symbol list or a parameter sweep) in one request.
+    Results keep the request order; a config that fails or times out carries its error instead of a result.
+    """
+    # caps this request's downloads and computations, so a large batch can't flood the shared threadpool
+    workers = asyncio.Semaphore(settings.BACKTEST_BATCH_WORKERS)
+
+    async def run(config: BacktestConfig) -> dict:
+        params = config.model_dump(exclude={"symbol"})
+        params["strategy_type"] = params["strategy_type"].lower()
+        try:
+            _check_backtest_params(
+                params["strategy_type"],
+                config.short_window,
+                config.long_window,
+                config.ema_fast,
+                config.ema_slow,
+                config.macd_fast,
+                config.macd_slow,
+            )
+            async with workers:
+                history = await _fetch_backtest_history(config.symbol, config.period, config.interval)
+                # the numeric kernels release the GIL, so worker threads scale without pickling histories.
+                # A thread can't be cancelled; it keeps its _batch_limiter slot until it finishes.
+                return await anyio.to_thread.run_sync(
+                    partial(_backtest_payload, history, symbol_upper=config.symbol.upper(), **params),
+                    limiter=_batch_limiter,
+                )
+        except HTTPException as exc:
+            return {"symbol": config.symbol.upper(), "status_code": exc.status_code, "detail": exc.detail}
+
+    tasks = [asyncio.ensure_future(run(config)) for config in batch.configs]
+    await asyncio.wait(tasks, timeout=settings.BACKTEST_BATCH_TIMEOUT_SECONDS)
+    results = []
+    for config, task in zip(batch.configs, tasks):
+        if task.done():
+            results.append(task.result())
+        else:
+            task.cancel()
+            results.append({"symbol": config.symbol.upper(), "status_code": 504, "detail": "Backtest timed out."})
+
+    # _save_backtests commits, so every id in the response refers to a durable row
+    await run_in_threadpool(_save_backtests, db, [result for result in results if "detail" not in result])
+    return ORJSONResponse({"results": results})
+
+
 @router.get("/backtests")
 def list_backtests(
     symbol: str | None = None,
     limit: int = Query(20, ge=1, le=100),
+    before_id: int | None = Query(None, ge=1),
     db: Session = Depends(get_db),
 ):
-    query = db.query(Backtest)
+    # plain column rows skip ORM instance construction; before_id is a keyset cursor for paging
+    query = select(Backtest.__table__)
     if symbol:
-        query = query.filter(Backtest.symbol == symbol.upper())
-    results = query.order_by(Backtest.created_at.desc()).limit(limit).all()
-    return [
-        {
-            "id": bt.id,
-            "created_at": bt.created_at.isoformat(),
-            "symbol": bt.symbol,
-            "strategy_type": getattr(bt, "strategy_type", "sma"),
-            "strategy_params": _deserialize_strategy_params(getattr(bt, "strategy_params", {})),
-            "short_window": bt.short_window,
-            "long_window": bt.long_window,
-            "period": bt.period,
-            "interval": bt.interval,
-            "initial_capital": bt.initial_capital,
-            "fee_rate": bt.fee_rate,
-            "metrics": {
-                "sharpe": bt.sharpe,
-                "max_drawdown": bt.max_drawdown,
-                "total_return": bt.total_return,
-                "win_rate": bt.win_rate,
-                "num_trades": bt.num_trades,
-            },
-        }
-        for bt in results
-    ]
+        query = query.where(Backtest.symbol == symbol.upper())
+    if before_id is not None:
+        # continue strictly after the cursor row in (created_at, id) order, the same order the page is sorted in;
+        # created_at is stamped before INSERT by concurrent workers, so id order alone can disagree with it
+        cursor_created_at = db.scalar(select(Backtest.created_at).where(Backtest.id == before_id))
+        if cursor_created_at is None:
+            # an unknown cursor would otherwise return an empty page, which reads as the end of the history
+            raise HTTPException(status_code=404, detail="Backtest not found")
+        query = query.where(
+            or_(
+                Backtest.created_at < cursor_created_at,
+                and_(Backtest.created_at == cursor_created_at, Backtest.id < before_id),
+            )
+        )
+    query = query.order_by(Backtest.created_at.desc(), Backtest.id.desc()).limit(limit)
+    return [_serialize_backtest(row) for row in db.execute(query)]
 
 
 @router.get("/backtests/{backtest_id}")
-def get_backtest(backtest_id: int, db: Session = Depends(get_db)):
+def get_backtest(backtest_id: int, request: Request, db: Session = Depends(get_db)):
     bt = db.query(Backtest).filter(Backtest.id == backtest_id).first()
     if not bt:
         raise HTTPException(status_code=404, detail="Backtest not found")
-    return {
-        "id": bt.id,
-        "created_at": bt.created_at.isoformat(),
-        "symbol": bt.symbol,
-        "strategy_type": getattr(bt, "strategy_type", "sma"),
-        "strategy_params": _deserialize_strategy_params(getattr(bt, "strategy_params", {})),
-        "short_window": bt.short_window,
-        "long_window": bt.long_window,
-        "period": bt.period,
-        "interval": bt.interval,
-        "initial_capital": bt.initial_capital,
-        "fee_rate": bt.fee_rate,
-        "metrics": {
-            "sharpe": bt.sharpe,
-            "max_drawdown": bt.max_drawdown,
-            "total_return": bt.total_return,
-            "win_rate": bt.win_rate,
-            "num_trades": bt.num_trades,
-        },
-    }
+    # stored backtests never change, so id + created_at identifies the body without rendering it
+    etag = f'W/"{bt.id}-{int(bt.created_at.timestamp())}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return ORJSONResponse(_serialize_backtest(bt), headers={"ETag": etag})
 
 
 @router.post("/strategies")
-def create_strategy(profile: dict, db: Session = Depends(get_db)):
-    required = ["name", "short_window", "long_window", "period", "interval", "initial_capital", "fee_rate"]
-    for key in required:
-        if key not in profile:
-            raise HTTPException(status_code=400, detail=f"Missing required field: {key}")
-
-    if db.query(StrategyProfile).filter(StrategyProfile.name == profile["name"]).first():
+def create_strategy(profile: StrategyProfileCreate, db: Session = Depends(get_db)):
+    if db.query(StrategyProfile).filter(StrategyProfile.name == profile.name).first():
         raise HTTPException(status_code=400, detail="A profile with this name already exists.")
 
     max_order = db.query(func.max(StrategyProfile.order_index)).scalar() or 0
 
-    item = StrategyProfile(
-        name=profile["name"],
-        symbol=profile.get("symbol", None),
-        short_window=int(profile["short_window"]),
-        long_window=int(profile["long_window"]),
-        period=profile.get("period", "3mo"),
-        interval=profile.get("interval", "1d"),
-        initial_capital=float(profile.get("initial_capital", 10_000)),
-        fee_rate=float(profile.get("fee_rate", 0.0005)),
-        order_index=max_order + 1,
-    )
+    item = StrategyProfile(**profile.model_dump(), order_index=max_order + 1)
     db.add(item)
     db.commit()
     db.refresh(item)
@@ -487,40 +545,21 @@ def create_strategy(profile: dict, db: Session = Depends(get_db)):
 @router.get("/strategies")
 def list_strategies(db: Session = Depends(get_db)):
     items = db.query(StrategyProfile).order_by(StrategyProfile.order_index.asc(), StrategyProfile.id.asc()).all()
-    return [
-        {
-            "id": s.id,
-            "created_at": s.created_at.isoformat(),
-            "name": s.name,
-            "symbol": s.symbol,
-            "short_window": s.short_window,
-            "long_window": s.long_window,
-            "period": s.period,
-            "interval": s.interval,
-            "initial_capital": s.initial_capital,
-            "fee_rate": s.fee_rate,
-        }
-        for s in items
-    ]
+    return [_serialize_strategy(s) for s in items]
 
 
 @router.get("/strategies/{strategy_id}")
-def get_strategy(strategy_id: int, db: Session = Depends(get_db)):
+def get_strategy(strategy_id: int, request: Request, db: Session = Depends(get_db)):
     s = db.query(StrategyProfile).filter(StrategyProfile.id == strategy_id).first()
     if not s:
         raise HTTPException(status_code=404, detail="Strategy not found")
-    return {
-        "id": s.id,
-        "created_at": s.created_at.isoformat(),
-        "name": s.name,
-        "symbol": s.symbol,
-        "short_window": s.short_window,
-        "long_window": s.long_window,
-        "period": s.period,
-        "interval": s.interval,
-        "initial_capital": s.initial_capital,
-        "fee_rate": s.fee_rate,
-    }
+    response = ORJSONResponse(_serialize_strategy(s))
+    # profiles can be renamed, so the tag is a hash of the rendered body
+    etag = f'"{hashlib.blake2b(response.body, digest_size=8).hexdigest()}"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.delete("/strategies/{strategy_id}")
@@ -554,26 +593,39 @@ def duplicate_strategy(strategy_id: int, db: Session = Depends(get_db)):
     original = db.query(StrategyProfile).filter(StrategyProfile.id == strategy_id).first()
     if not original:
         raise HTTPException(status_code=404, detail="Profile not found")
-    max_order = db.query(func.max(StrategyProfile.order_index)).scalar() or 0
     base_name = f"{original.name} (Copy)"
-    new_name = base_name
-    suffix = 1
-    while db.query(StrategyProfile).filter(StrategyProfile.name == new_name).first():
-        suffix += 1
-        new_name = f"{base_name} {suffix}"
-    copy = StrategyProfile(
-        name=new_name,
-        symbol=original.symbol,
-        short_window=original.short_window,
-        long_window=original.long_window,
-        period=original.period,
-        interval=original.interval,
-        initial_capital=original.initial_capital,
-        fee_rate=original.fee_rate,
-        order_index=max_order + 1,
-    )
-    db.add(copy)
-    db.commit()
+    for _ in range(3):
+        max_order = db.query(func.max(StrategyProfile.order_index)).scalar() or 0
+        # one round trip for every name the probe could collide with; lowest free suffix wins
+        taken = set(
+            db.scalars(select(StrategyProfile.name).where(StrategyProfile.name.startswith(base_name, autoescape=True)))
+        )
+        new_name = base_name
+        suffix = 1
+        while new_name in taken:
+            suffix += 1
+            new_name = f"{base_name} {suffix}"
+        copy = StrategyProfile(
+            name=new_name,
+            symbol=original.symbol,
+            short_window=original.short_window,
+            long_window=original.long_window,
+            period=original.period,
+            interval=original.interval,
+            initial_capital=original.initial_capital,
+            fee_rate=original.fee_rate,
+            order_index=max_order + 1,
+        )
+        db.add(copy)
+        try:
+            db.commit()
+        except IntegrityError:
+            # a concurrent duplicate took the name between the probe and the insert
+            db.rollback()
+            continue
+        break
+    else:
+        raise HTTPException(status_code=409, detail="Could not pick a free name for the copy, try again.")
     db.refresh(copy)
     return {"id": copy.id, "status": "duplicated", "name": copy.name}
 
@@ -583,18 +635,41 @@ def move_strategy(strategy_id: int, data: dict, db: Session = Depends(get_db)):
     direction = data.get("direction")
     if direction not in ["up", "down"]:
         raise HTTPException(status_code=400, detail="Invalid direction")
-    items = db.query(StrategyProfile).order_by(StrategyProfile.order_index.asc(), StrategyProfile.id.asc()).all()
-    index = next((i for i, p in enumerate(items) if p.id == strategy_id), None)
-    if index is None:
+    current = db.execute(
+        select(StrategyProfile.id, StrategyProfile.order_index).where(StrategyProfile.id == strategy_id)
+    ).first()
+    if current is None:
         raise HTTPException(status_code=404, detail="Profile not found")
-    if direction == "up" and index == 0:
-        return {"status": "nochange"}
-    if direction == "down" and index == len(items) - 1:
+
+    # neighbour in (order_index, id) order, i.e. the row it trades places with in the list
+    same_slot = StrategyProfile.order_index == current.order_index
+    if direction == "up":
+        before = or_(
+            StrategyProfile.order_index < current.order_index, and_(same_slot, StrategyProfile.id < current.id)
+        )
+        neighbour_query = select(StrategyProfile.id, StrategyProfile.order_index).where(before).order_by(
+            StrategyProfile.order_index.desc(), StrategyProfile.id.desc()
+        )
+    else:
+        after = or_(
+            StrategyProfile.order_index > current.order_index, and_(same_slot, StrategyProfile.id > current.id)
+        )
+        neighbour_query = select(StrategyProfile.id, StrategyProfile.order_index).where(after).order_by(
+            StrategyProfile.order_index.asc(), StrategyProfile.id.asc()
+        )
+    neighbour = db.execute(neighbour_query.limit(1)).first()
+    if neighbour is None:
         return {"status": "nochange"}
-    swap_index = index - 1 if direction == "up" else index + 1
-    items[index].order_index, items[swap_index].order_index = (
-        items[swap_index].order_index,
-        items[index].order_index,
+
+    db.execute(
+        update(StrategyProfile)
+        .where(StrategyProfile.id.in_([current.id, neighbour.id]))
+        .values(
+            order_index=case(
+                (StrategyProfile.id == current.id, neighbour.order_index),
+                else_=current.order_index,
+            )
+        )
     )
     db.commit()
     return {"status": "reordered"}
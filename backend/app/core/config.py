@@ -1,3 +1,5 @@
+import os
+
 from pydantic_settings import BaseSettings
 
 
@@ -5,6 +7,13 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "Algo Trading Platform"
     API_V1_STR: str = "/api"
     DATABASE_URL: str = "sqlite:///./test.db"
+    HISTORY_CACHE_TTL_SECONDS: int = 3600
+    INTRADAY_HISTORY_CACHE_TTL_SECONDS: int = 60
+    HISTORY_CACHE_MAX_ENTRIES: int = 256
+    THREADPOOL_SIZE: int = 64
+    BACKTEST_BATCH_MAX_CONFIGS: int = 50
+    BACKTEST_BATCH_WORKERS: int = os.cpu_count() or 4
+    BACKTEST_BATCH_TIMEOUT_SECONDS: float = 120.0
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,78 @@
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+from app.db.session import Base, engine
+from app.models.backtest import Backtest
+from app.models.strategy_profile import StrategyProfile
+
+# arbitrary app-wide key for pg_advisory_xact_lock; serializes schema setup across workers
+_SCHEMA_LOCK_KEY = 724_311_905
+
+# indexes from earlier schemas that a current index now covers; create_all never removes them
+_SUPERSEDED_INDEXES = (
+    # the leading column of ix_backtests_symbol_created_at_id
+    "ix_backtests_symbol",
+)
+
+# set once the schema is known to be current, so re-entering the lifespan (tests, reloads) skips DDL
+_schema_ready = False
+
+
+def _ensure_schema(conn: Connection) -> None:
+    """
+    Lightweight guard that adds columns introduced after the first schema.
+    """
+    if conn.dialect.name == "postgresql":
+        conn.execute(
+            text(
+                "DO $$ BEGIN IF NOT EXISTS (SELECT 1 FROM information_schema.columns "
+                "WHERE table_name='strategy_profiles' AND column_name='order_index') THEN "
+                "ALTER TABLE strategy_profiles ADD COLUMN order_index INTEGER DEFAULT 0; "
+                "END IF; "
+                "IF NOT EXISTS (SELECT 1 FROM information_schema.columns "
+                "WHERE table_name='backtests' AND column_name='strategy_type') THEN "
+                "ALTER TABLE backtests ADD COLUMN strategy_type TEXT DEFAULT 'sma'; "
+                "END IF; "
+                "IF NOT EXISTS (SELECT 1 FROM information_schema.columns "
+                "WHERE table_name='backtests' AND column_name='strategy_params') THEN "
+                "ALTER TABLE backtests ADD COLUMN strategy_params JSONB; "
+                "END IF; "
+                "END $$;"
+            )
+        )
+    else:
+        # SQLite: attempt to add column; ignore if it exists
+        try:
+            conn.execute(text("ALTER TABLE strategy_profiles ADD COLUMN order_index INTEGER DEFAULT 0"))
+        except Exception:
+            pass
+        try:
+            conn.execute(text("ALTER TABLE backtests ADD COLUMN strategy_type TEXT DEFAULT 'sma'"))
+        except Exception:
+            pass
+        try:
+            conn.execute(text("ALTER TABLE backtests ADD COLUMN strategy_params TEXT"))
+        except Exception:
+            pass
+
+
+def init_db() -> None:
+    """
+    Create missing tables, columns and indexes, and drop superseded indexes.
+    Runs from the application startup hook, at most once per process.
+    """
+    global _schema_ready
+    if _schema_ready:
+        return
+    with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # other workers block here until the first one commits, then find nothing to do
+            conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _SCHEMA_LOCK_KEY})
+        Base.metadata.create_all(bind=conn)
+        _ensure_schema(conn)
+        # create_all only builds indexes together with new tables
+        for index in (*Backtest.__table__.indexes, *StrategyProfile.__table__.indexes):
+            index.create(bind=conn, checkfirst=True)
+        for name in _SUPERSEDED_INDEXES:
+            conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    _schema_ready = True
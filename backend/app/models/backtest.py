@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, Integer, String, Text
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import JSONB
 
 from app.db.session import Base
@@ -10,11 +10,15 @@ JSONType = JSONB().with_variant(Text, "sqlite")
 
 class Backtest(Base):
     __tablename__ = "backtests"
+    __table_args__ = (
+        # serves the per-symbol history listing (newest first) without a sort step
+        Index("ix_backtests_symbol_created_at_id", "symbol", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
 
-    symbol = Column(String, index=True, nullable=False)
+    symbol = Column(String, nullable=False)
     short_window = Column(Integer, nullable=False)
     long_window = Column(Integer, nullable=False)
     period = Column(String, nullable=False)
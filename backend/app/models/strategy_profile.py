@@ -1,12 +1,13 @@
 from datetime import datetime
 
-from sqlalchemy import Column, DateTime, Float, Integer, String
+from sqlalchemy import Column, DateTime, Float, Index, Integer, String
 
 from app.db.session import Base
 
 
 class StrategyProfile(Base):
     __tablename__ = "strategy_profiles"
+    __table_args__ = (Index("ix_strategy_profiles_order_index_id", "order_index", "id"),)
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
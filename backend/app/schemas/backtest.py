@@ -0,0 +1,31 @@
+from pydantic import BaseModel, Field
+
+from app.core.config import settings
+
+
+class BacktestConfig(BaseModel):
+    """
+    One backtest in a batch; fields and defaults mirror the GET /backtest/sma query parameters.
+    """
+
+    symbol: str = Field(min_length=1)
+    strategy_type: str = "sma"
+    short_window: int = Field(10, ge=1)
+    long_window: int = Field(20, ge=2)
+    period: str = "3mo"
+    interval: str = "1d"
+    initial_capital: float = Field(10_000, gt=0)
+    fee_rate: float = Field(0.0005, ge=0.0)
+    rsi_window: int = Field(14, ge=1)
+    rsi_overbought: float = Field(70, ge=0)
+    rsi_oversold: float = Field(30, ge=0)
+    macd_fast: int = Field(12, ge=1)
+    macd_slow: int = Field(26, ge=2)
+    macd_signal: int = Field(9, ge=1)
+    ema_fast: int = Field(10, ge=1)
+    ema_slow: int = Field(20, ge=2)
+    response_format: str = Field("aos", alias="format", pattern="^(aos|soa)$")
+
+
+class BacktestBatchRequest(BaseModel):
+    configs: list[BacktestConfig] = Field(min_length=1, max_length=settings.BACKTEST_BATCH_MAX_CONFIGS)
@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+
+
+class StrategyProfileCreate(BaseModel):
+    name: str = Field(min_length=1)
+    symbol: str | None = None
+    short_window: int = Field(ge=1)
+    long_window: int = Field(ge=2)
+    period: str = "3mo"
+    interval: str = "1d"
+    initial_capital: float = Field(10_000, gt=0)
+    fee_rate: float = Field(0.0005, ge=0.0)
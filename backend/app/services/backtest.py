@@ -0,0 +1,146 @@
+from dataclasses import dataclass
+
+import numpy as np
+from numba import njit
+
+
+@dataclass
+class SimulationResult:
+    equity: np.ndarray
+    trade_index: np.ndarray
+    trade_side: np.ndarray
+    trade_price: np.ndarray
+    trade_shares: np.ndarray
+    trade_equity: np.ndarray
+    completed_trades: int
+    wins: int
+
+
+def _simulate_events(close, signal, events, cash0, fee_rate):
+    """
+    Long-only state machine that only visits bars in `events` (the non-zero signals).
+    Everything is float64/int64 scalars so the compiled loop never allocates or boxes;
+    rounding to cents happens once, in simulate_trades.
+    """
+    n = close.shape[0]
+    k = events.shape[0]
+    equity = np.empty(n)
+    trade_index = np.empty(k + 1, np.int64)
+    trade_side = np.empty(k + 1, np.int8)
+    trade_shares = np.empty(k + 1, np.int64)
+    trade_equity = np.empty(k + 1)
+    count = 0
+
+    cash = cash0
+    shares = 0
+    entry_price = 0.0
+    completed = 0
+    wins = 0
+    start = 0
+
+    for j in range(k):
+        i = events[j]
+        # scalar loop rather than a slice expression: numba would allocate a temporary per span
+        for t in range(start, i):
+            equity[t] = cash + shares * close[t]
+        start = i
+        price = close[i]
+        if signal[i] == 1 and shares == 0:
+            buy_shares = int(cash // price)
+            if buy_shares > 0:
+                shares = buy_shares
+                cost = shares * price
+                cash -= cost + cost * fee_rate
+                entry_price = price
+                trade_index[count] = i
+                trade_side[count] = 1
+                trade_shares[count] = shares
+                trade_equity[count] = cash + shares * price
+                count += 1
+        elif signal[i] == -1 and shares > 0:
+            proceeds = shares * price
+            cash += proceeds - proceeds * fee_rate
+            completed += 1
+            if price > entry_price:
+                wins += 1
+            trade_index[count] = i
+            trade_side[count] = -1
+            trade_shares[count] = shares
+            trade_equity[count] = cash
+            count += 1
+            shares = 0
+    for t in range(start, n):
+        equity[t] = cash + shares * close[t]
+
+    if shares > 0 and n > 0:
+        price = close[n - 1]
+        proceeds = shares * price
+        cash += proceeds - proceeds * fee_rate
+        completed += 1
+        if price > entry_price:
+            wins += 1
+        trade_index[count] = n - 1
+        trade_side[count] = -1
+        trade_shares[count] = shares
+        trade_equity[count] = cash
+        count += 1
+        equity[n - 1] = cash
+
+    return (
+        equity,
+        trade_index[:count],
+        trade_side[:count],
+        trade_shares[:count],
+        trade_equity[:count],
+        completed,
+        wins,
+    )
+
+
+_simulate = njit(cache=True, nogil=True)(_simulate_events)
+# compile once at import so the first request doesn't pay the JIT cost
+_simulate(np.ones(2), np.zeros(2, dtype=np.int8), np.zeros(0, dtype=np.int64), 1.0, 0.0)
+
+
+def simulate_trades(close: np.ndarray, signal: np.ndarray, initial_capital: float, fee_rate: float) -> SimulationResult:
+    """
+    Long-only, all-in simulation driven by +1 (enter) / -1 (exit) signals.
+    Any position still open on the last bar is closed at its close.
+    """
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    signal = np.ascontiguousarray(signal, dtype=np.int8)
+    events = np.flatnonzero(signal)
+    equity, trade_index, trade_side, trade_shares, trade_equity, completed, wins = _simulate(
+        close, signal, events, float(initial_capital), float(fee_rate)
+    )
+    # round the kernel's buffers in place; callers use the same array for metrics and the response
+    return SimulationResult(
+        equity=np.round(equity, 2, out=equity),
+        trade_index=trade_index,
+        trade_side=trade_side,
+        trade_price=close[trade_index],
+        trade_shares=trade_shares,
+        trade_equity=np.round(trade_equity, 2, out=trade_equity),
+        completed_trades=int(completed),
+        wins=int(wins),
+    )
+
+
+def risk_metrics(equity: np.ndarray) -> tuple[float, float]:
+    """
+    Annualised Sharpe ratio of bar-to-bar returns and max drawdown (a negative fraction).
+    Plain NumPy over the equity curve; both are 0.0 when undefined.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = np.diff(equity) / equity[:-1]
+        returns_std = returns.std(ddof=1) if returns.size > 1 else 0.0
+        if returns_std > 0:
+            sharpe = float(returns.mean() / returns_std * np.sqrt(252))
+        else:
+            sharpe = 0.0
+
+        rolling_max = np.maximum.accumulate(equity)
+        drawdown = equity - rolling_max
+        drawdown /= rolling_max
+    max_drawdown = float(drawdown.min()) if drawdown.size else 0.0
+    return sharpe, max_drawdown
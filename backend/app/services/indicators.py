@@ -0,0 +1,99 @@
+import numpy as np
+import pandas as pd
+from numba import njit
+from scipy.signal import lfilter
+
+
+def _rolling_mean(values, window):
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    # Kahan-compensated running sum; a cumsum difference drifts on long series
+    total = 0.0
+    compensation = 0.0
+    missing = 0
+    for i in range(n):
+        if np.isnan(values[i]):
+            missing += 1
+        else:
+            y = values[i] - compensation
+            t = total + y
+            compensation = (t - total) - y
+            total = t
+        if i >= window:
+            if np.isnan(values[i - window]):
+                missing -= 1
+            else:
+                y = -values[i - window] - compensation
+                t = total + y
+                compensation = (t - total) - y
+                total = t
+        # like pandas, a window with any NaN has no mean
+        if i >= window - 1 and missing == 0:
+            out[i] = total / window
+    return out
+
+
+_rolling_mean_kernel = njit(cache=True, nogil=True)(_rolling_mean)
+_rolling_mean_kernel(np.ones(3), 2)
+
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing simple moving average, equivalent to ``Series.rolling(window).mean()``.
+    The first window - 1 bars, and any window containing a NaN, are NaN.
+    """
+    return _rolling_mean_kernel(np.ascontiguousarray(values, dtype=np.float64), int(window))
+
+
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """
+    Recursive EMA, equivalent to ``Series.ewm(span=span, adjust=False).mean()``.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.shape[0] == 0 or np.isnan(values).any():
+        # the IIR filter would carry a NaN forward forever; pandas skips over gaps
+        return pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()
+    alpha = 2.0 / (span + 1.0)
+    # seed the filter state so the first output equals the first input
+    out, _ = lfilter([alpha], [1.0, alpha - 1.0], values, zi=[(1.0 - alpha) * values[0]])
+    return out
+
+
+def _wilder_rsi(close, window):
+    n = close.shape[0]
+    out = np.full(n, np.nan)
+    if n <= window:
+        return out
+
+    # seed with the simple average of the first `window` changes, then smooth recursively
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, window + 1):
+        delta = close[i] - close[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= window
+    avg_loss /= window
+
+    for i in range(window, n):
+        if i > window:
+            delta = close[i] - close[i - 1]
+            avg_gain = (avg_gain * (window - 1) + max(delta, 0.0)) / window
+            avg_loss = (avg_loss * (window - 1) + max(-delta, 0.0)) / window
+        # RS is undefined until the first loss; leave those bars NaN
+        if avg_loss > 0:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+    return out
+
+
+_wilder_rsi_kernel = njit(cache=True, nogil=True)(_wilder_rsi)
+_wilder_rsi_kernel(np.ones(3), 1)
+
+
+def wilder_rsi(close: np.ndarray, window: int) -> np.ndarray:
+    """
+    Wilder's RSI; the first `window` bars (and any bars before the first loss) are NaN.
+    """
+    return _wilder_rsi_kernel(np.ascontiguousarray(close, dtype=np.float64), int(window))
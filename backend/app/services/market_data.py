@@ -0,0 +1,119 @@
+import asyncio
+import time
+from collections import Counter, OrderedDict
+
+import numpy as np
+import pandas as pd
+from fastapi.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+_DAILY_INTERVALS = {"1d", "5d", "1wk", "1mo", "3mo"}
+
+# LRU order: least recently used first. Only touched from the event loop, so no locking needed.
+_history_cache: OrderedDict[tuple[str, str, str], tuple[float, pd.DataFrame]] = OrderedDict()
+# per-key download locks exist only while some request holds or waits on them
+_history_locks: dict[tuple[str, str, str], asyncio.Lock] = {}
+_history_lock_users: Counter[tuple[str, str, str]] = Counter()
+
+
+def _cache_ttl(interval: str) -> int:
+    if interval in _DAILY_INTERVALS:
+        return settings.HISTORY_CACHE_TTL_SECONDS
+    return settings.INTRADAY_HISTORY_CACHE_TTL_SECONDS
+
+
+def _download_history(symbol: str, period: str, interval: str) -> pd.DataFrame:
+    # imported lazily: yfinance pulls in curl_cffi, lxml and friends, which
+    # workers that never serve market data shouldn't pay for at startup
+    import yfinance as yf
+
+    # a fresh Ticker per download: history() keeps per-call metadata on the instance,
+    # so one shared across worker threads is unsafe. yfinance already shares the HTTP session.
+    return yf.Ticker(symbol).history(period=period, interval=interval)
+
+
+def _cache_get(key: tuple[str, str, str]) -> pd.DataFrame | None:
+    cached = _history_cache.get(key)
+    if cached is None:
+        return None
+    if cached[0] <= time.monotonic():
+        del _history_cache[key]
+        return None
+    _history_cache.move_to_end(key)
+    return cached[1]
+
+
+def _cache_put(key: tuple[str, str, str], history: pd.DataFrame, interval: str) -> None:
+    _history_cache[key] = (time.monotonic() + _cache_ttl(interval), history)
+    _history_cache.move_to_end(key)
+    while len(_history_cache) > settings.HISTORY_CACHE_MAX_ENTRIES:
+        _history_cache.popitem(last=False)
+
+
+async def fetch_history(symbol: str, period: str, interval: str) -> pd.DataFrame:
+    """
+    Yahoo Finance OHLCV history, cached in-process in a bounded LRU with a short TTL.
+
+    Concurrent requests for the same key wait on a single download. Empty
+    results are not cached. Callers get a shallow copy and may add columns freely.
+    """
+    key = (symbol.upper(), period, interval)
+    history = _cache_get(key)
+    if history is not None:
+        return history.copy(deep=False)
+
+    lock = _history_locks.setdefault(key, asyncio.Lock())
+    _history_lock_users[key] += 1
+    try:
+        async with lock:
+            history = _cache_get(key)
+            if history is None:
+                history = await run_in_threadpool(_download_history, symbol, period, interval)
+                if not history.empty:
+                    _cache_put(key, history, interval)
+    finally:
+        # drop the lock with its last user, so empty or failed lookups of arbitrary symbols don't pile up
+        _history_lock_users[key] -= 1
+        if not _history_lock_users[key]:
+            del _history_lock_users[key]
+            del _history_locks[key]
+    return history.copy(deep=False)
+
+
+def _wall_clock_and_utc(timestamps: pd.Index | pd.Series) -> tuple[pd.DatetimeIndex, pd.DatetimeIndex]:
+    index = pd.DatetimeIndex(timestamps)
+    if index.tz is None:
+        return index, index
+    return index.tz_localize(None), index.tz_convert("UTC").tz_localize(None)
+
+
+def iso_timestamps(timestamps: pd.Index | pd.Series) -> list[str]:
+    """
+    Vectorised ``[ts.isoformat() for ts in timestamps]`` for whole-second bars.
+    """
+    local, utc = _wall_clock_and_utc(timestamps)
+    local_values = local.to_numpy()
+    seconds = local_values.astype("datetime64[s]")
+    if (seconds != local_values).any():
+        return [ts.isoformat() for ts in pd.DatetimeIndex(timestamps)]
+
+    formatted = np.datetime_as_string(seconds, unit="s")
+    if local is utc:
+        return formatted.tolist()
+
+    offsets = ((local - utc) // pd.Timedelta(seconds=1)).to_numpy(dtype=np.int64)
+    unique_offsets, inverse = np.unique(offsets, return_inverse=True)
+    suffixes = np.array(
+        [f"{'-' if off < 0 else '+'}{abs(off) // 3600:02d}:{abs(off) % 3600 // 60:02d}" for off in unique_offsets.tolist()],
+        dtype="U6",
+    )
+    return np.char.add(formatted, suffixes[inverse]).tolist()
+
+
+def epoch_seconds(timestamps: pd.Index | pd.Series) -> list[int]:
+    """
+    Vectorised ``[int(ts.timestamp()) for ts in timestamps]``.
+    """
+    _, utc = _wall_clock_and_utc(timestamps)
+    return utc.to_numpy().astype("datetime64[s]").astype(np.int64).tolist()
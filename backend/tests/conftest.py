@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+
+import pytest
+
+# point the app at a throwaway SQLite file; this has to happen before test modules import app.*,
+# which pytest does while collecting, after conftest is loaded
+_db_dir = tempfile.mkdtemp(prefix="algo-trading-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/test.db"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """
+    Create the schema once in the temporary database and remove the file after the run.
+    """
+    from app.db.init_db import init_db
+    from app.db.session import engine
+
+    init_db()
+    yield engine
+    engine.dispose()
+    shutil.rmtree(_db_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def fake_history(monkeypatch):
+    """
+    Replace the routes' history fetch with synthetic daily bars, seeded by the symbol; "EMPTY" has no data.
+    Returns the fake so tests can wrap it.
+    """
+    import numpy as np
+    import pandas as pd
+
+    from app.api.v1 import routes
+
+    async def fetch_history(symbol, period, interval):
+        if symbol == "EMPTY":
+            return pd.DataFrame()
+        close = 100 * np.exp(np.random.default_rng(len(symbol)).normal(0, 0.02, 120).cumsum())
+        index = pd.date_range("2024-01-02", periods=close.size, freq="B", tz="America/New_York", name="Date")
+        return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1_000}, index=index)
+
+    monkeypatch.setattr(routes, "fetch_history", fetch_history)
+    return fetch_history
+
+
+@pytest.fixture
+def make_backtest():
+    """
+    Insert a committed Backtest row with neutral defaults; keyword arguments override columns.
+    """
+    from app.db.session import SessionLocal
+    from app.models.backtest import Backtest
+
+    def make(**overrides):
+        columns = {
+            "symbol": "TEST",
+            "short_window": 5,
+            "long_window": 20,
+            "period": "3mo",
+            "interval": "1d",
+            "initial_capital": 10_000,
+            "fee_rate": 0.0,
+            "strategy_type": "sma",
+            "sharpe": 0.0,
+            "max_drawdown": 0.0,
+            "total_return": 0.0,
+            "win_rate": 0.0,
+            "num_trades": 0,
+        }
+        row = Backtest(**{**columns, **overrides})
+        # keep the loaded id/created_at readable once the session is closed
+        with SessionLocal(expire_on_commit=False) as db:
+            db.add(row)
+            db.commit()
+        return row
+
+    return make
@@ -0,0 +1,67 @@
+import asyncio
+
+import pandas as pd
+from fastapi.testclient import TestClient
+
+from app.api.v1 import routes
+from app.core.config import settings
+from app.main import app
+
+
+def test_batch_keeps_order_and_reports_failures_per_config(fake_history):
+    configs = [
+        {"symbol": "aapl", "strategy_type": "sma", "short_window": 5, "long_window": 20},
+        {"symbol": "msft", "strategy_type": "ema", "ema_fast": 30, "ema_slow": 10},
+        {"symbol": "EMPTY"},
+        {"symbol": "nvda", "strategy_type": "rsi", "format": "soa"},
+    ]
+
+    with TestClient(app) as client:
+        resp = client.post("/api/v1/backtest/batch", json={"configs": configs})
+        results = resp.json()["results"]
+
+        assert resp.status_code == 200
+        assert [r["symbol"] for r in results] == ["AAPL", "MSFT", "EMPTY", "NVDA"]
+        assert [r.get("status_code") for r in results] == [None, 400, 404, None]
+        assert isinstance(results[3]["equity_curve"]["equity"], list)
+        assert client.get(f"/api/v1/backtests/{results[0]['id']}").json()["symbol"] == "AAPL"
+
+
+def test_batch_caps_concurrent_downloads(monkeypatch):
+    in_flight = peak = 0
+
+    async def slow_fetch_history(symbol, period, interval):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return pd.DataFrame()
+
+    monkeypatch.setattr(routes, "fetch_history", slow_fetch_history)
+    monkeypatch.setattr(settings, "BACKTEST_BATCH_WORKERS", 2)
+
+    with TestClient(app) as client:
+        resp = client.post("/api/v1/backtest/batch", json={"configs": [{"symbol": f"S{i}"} for i in range(8)]})
+
+    assert [r["status_code"] for r in resp.json()["results"]] == [404] * 8
+    assert peak == 2
+
+
+def test_batch_reports_timed_out_configs_and_keeps_finished_ones(monkeypatch, fake_history):
+    async def fetch_history(symbol, period, interval):
+        if symbol == "SLOW":
+            await asyncio.sleep(30)
+        return await fake_history(symbol, period, interval)
+
+    monkeypatch.setattr(routes, "fetch_history", fetch_history)
+    monkeypatch.setattr(settings, "BACKTEST_BATCH_TIMEOUT_SECONDS", 1.0)
+
+    with TestClient(app) as client:
+        resp = client.post("/api/v1/backtest/batch", json={"configs": [{"symbol": "aapl"}, {"symbol": "SLOW"}]})
+    results = resp.json()["results"]
+
+    assert resp.status_code == 200
+    assert [r["symbol"] for r in results] == ["AAPL", "SLOW"]
+    assert "id" in results[0]
+    assert results[1] == {"symbol": "SLOW", "status_code": 504, "detail": "Backtest timed out."}
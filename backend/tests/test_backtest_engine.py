@@ -0,0 +1,73 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.services.backtest import risk_metrics, simulate_trades
+
+
+def test_round_trip_trade():
+    close = np.array([10.0, 10.0, 12.0, 11.0, 11.0])
+    signal = np.array([0, 1, 0, -1, 0])
+    result = simulate_trades(close, signal, initial_capital=100, fee_rate=0.0)
+
+    assert result.trade_index.tolist() == [1, 3]
+    assert result.trade_side.tolist() == [1, -1]
+    assert result.trade_shares.tolist() == [10, 10]
+    assert result.equity.tolist() == [100.0, 100.0, 120.0, 110.0, 110.0]
+    assert result.completed_trades == 1
+    assert result.wins == 1
+
+
+def test_open_position_closed_on_last_bar():
+    close = np.array([10.0, 8.0, 9.0])
+    signal = np.array([1, 0, 0])
+    result = simulate_trades(close, signal, initial_capital=100, fee_rate=0.01)
+
+    assert result.trade_side.tolist() == [1, -1]
+    assert result.trade_index.tolist() == [0, 2]
+    assert result.equity[-1] == round(100 - 101 + 90 - 0.9, 2)
+    assert result.completed_trades == 1
+    assert result.wins == 0
+
+
+def _bar_by_bar(close, signal, cash, fee_rate):
+    shares = 0
+    equity = []
+    for price, sig in zip(close.tolist(), signal.tolist()):
+        if sig == 1 and shares == 0 and cash // price > 0:
+            shares = int(cash // price)
+            cash -= shares * price * (1 + fee_rate)
+        elif sig == -1 and shares > 0:
+            cash += shares * price * (1 - fee_rate)
+            shares = 0
+        equity.append(cash + shares * price)
+    if shares > 0:
+        equity[-1] = cash + shares * close[-1] * (1 - fee_rate)
+    return np.array(equity)
+
+
+def test_event_driven_equity_matches_bar_by_bar():
+    rng = np.random.default_rng(1)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, 500)))
+    position = (rng.random(500) > 0.9).astype(np.int8)
+    signal = np.diff(position, prepend=position[0])
+
+    result = simulate_trades(close, signal, initial_capital=10_000, fee_rate=0.001)
+    expected = _bar_by_bar(close, signal, 10_000.0, 0.001)
+
+    np.testing.assert_allclose(result.equity, expected, atol=0.006)
+
+
+def test_risk_metrics_match_pandas():
+    rng = np.random.default_rng(3)
+    equity = 10_000 * np.exp(np.cumsum(rng.normal(0, 0.01, 250)))
+    series = pd.Series(equity)
+    returns = series.pct_change().dropna()
+    expected_sharpe = returns.mean() / returns.std() * np.sqrt(252)
+    expected_drawdown = ((series - series.cummax()) / series.cummax()).min()
+
+    sharpe, max_drawdown = risk_metrics(equity)
+
+    assert sharpe == pytest.approx(expected_sharpe)
+    assert max_drawdown == pytest.approx(expected_drawdown)
+    assert risk_metrics(np.full(5, 100.0)) == (0.0, 0.0)
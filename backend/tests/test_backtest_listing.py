@@ -0,0 +1,34 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_backtest_pages_follow_created_at_order(make_backtest):
+    symbol = f"PAGE{uuid4().hex[:8]}".upper()
+    base = datetime(2024, 1, 1)
+    # insert order (ids) deliberately disagrees with created_at, with one created_at tie
+    offsets = [3, 1, 4, 1, 5, 0, 2]
+    rows = [make_backtest(symbol=symbol, created_at=base + timedelta(minutes=offset)) for offset in offsets]
+    expected = [row.id for row in sorted(rows, key=lambda row: (row.created_at, row.id), reverse=True)]
+
+    with TestClient(app) as client:
+        seen = []
+        params = {"symbol": symbol, "limit": 2}
+        while True:
+            page = client.get("/api/v1/backtests", params=params).json()
+            if not page:
+                break
+            seen.extend(item["id"] for item in page)
+            params["before_id"] = page[-1]["id"]
+
+    assert seen == expected
+
+
+def test_backtest_listing_rejects_unknown_cursor():
+    with TestClient(app) as client:
+        resp = client.get("/api/v1/backtests", params={"before_id": 2**31 - 1})
+
+    assert resp.status_code == 404
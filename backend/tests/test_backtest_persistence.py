@@ -0,0 +1,61 @@
+import asyncio
+import json
+
+from sqlalchemy import select
+
+from app.db.session import SessionLocal
+from app.main import app
+from app.models.backtest import Backtest
+
+
+def _committed(backtest_id: int) -> bool:
+    # a separate session only sees rows that have been committed
+    with SessionLocal() as db:
+        return db.scalar(select(Backtest.id).where(Backtest.id == backtest_id)) is not None
+
+
+async def _call(method: str, path: str, query: str = "", body: bytes = b"") -> list[dict]:
+    """
+    Drive the ASGI app directly and record, for each response body message, whether its row is committed.
+    """
+    seen = []
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body" and message.get("body"):
+            payload = json.loads(message["body"])
+            results = payload.get("results", [payload])
+            seen.extend({"id": r["id"], "committed": _committed(r["id"])} for r in results if "id" in r)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    await app(scope, receive, send)
+    return seen
+
+
+def test_backtest_row_is_committed_before_the_response_is_sent(fake_history):
+    seen = asyncio.run(_call("GET", "/api/v1/backtest/sma", "symbol=commit-check"))
+
+    assert [row["committed"] for row in seen] == [True]
+
+
+def test_batch_rows_are_committed_before_the_response_is_sent(fake_history):
+    body = json.dumps({"configs": [{"symbol": "commit-a"}, {"symbol": "commit-b", "strategy_type": "ema"}]})
+
+    seen = asyncio.run(_call("POST", "/api/v1/backtest/batch", body=body.encode()))
+
+    assert [row["committed"] for row in seen] == [True, True]
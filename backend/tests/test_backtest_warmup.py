@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.v1 import routes
+from app.main import app
+
+
+@pytest.fixture
+def short_history(monkeypatch, fake_history):
+    async def fetch_history(symbol, period, interval):
+        if symbol == "RISING":
+            # no losing bar, so the RSI is never defined
+            close = np.linspace(100.0, 200.0, 60)
+            index = pd.date_range("2024-01-02", periods=close.size, freq="B", tz="America/New_York", name="Date")
+            return pd.DataFrame({"Open": close, "High": close, "Low": close, "Close": close, "Volume": 1_000}, index=index)
+        history = await fake_history(symbol, period, interval)
+        return history.iloc[:15]
+
+    monkeypatch.setattr(routes, "fetch_history", fetch_history)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"symbol": "SHORT", "strategy_type": "sma", "short_window": 5, "long_window": 20},
+        {"symbol": "RISING", "strategy_type": "rsi"},
+    ],
+)
+def test_backtest_rejects_history_consumed_by_warmup(short_history, params):
+    with TestClient(app) as client:
+        resp = client.get("/api/v1/backtest/sma", params=params)
+        listed = client.get("/api/v1/backtests", params={"symbol": params["symbol"]}).json()
+
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == "Not enough bars for the requested indicator windows."
+    assert listed == []
+
+
+def test_batch_reports_history_consumed_by_warmup_per_config(short_history):
+    configs = [{"symbol": "SHORT", "long_window": 20}, {"symbol": "SHORT", "short_window": 3, "long_window": 5}]
+
+    with TestClient(app) as client:
+        results = client.post("/api/v1/backtest/batch", json={"configs": configs}).json()["results"]
+
+    assert results[0] == {
+        "symbol": "SHORT",
+        "status_code": 400,
+        "detail": "Not enough bars for the requested indicator windows.",
+    }
+    assert "id" in results[1]
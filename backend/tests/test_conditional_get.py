@@ -0,0 +1,49 @@
+from uuid import uuid4
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_backtest_weak_etag_revalidation(make_backtest):
+    backtest_id = make_backtest().id
+
+    with TestClient(app) as client:
+        url = f"/api/v1/backtests/{backtest_id}"
+        first = client.get(url)
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+        assert etag.startswith('W/"')
+
+        strong = client.get(url, headers={"If-None-Match": etag.removeprefix("W/")})
+        assert strong.status_code == 304
+        assert strong.headers["etag"] == etag
+
+        listed = client.get(url, headers={"If-None-Match": f'"stale", {etag}, W/"other"'})
+        assert listed.status_code == 304
+
+        stale = client.get(url, headers={"If-None-Match": '"stale"'})
+        assert stale.status_code == 200
+
+
+def test_strategy_etag_revalidation():
+    with TestClient(app) as client:
+        created = client.post(
+            "/api/v1/strategies", json={"name": f"etag-{uuid4().hex}", "short_window": 5, "long_window": 20}
+        ).json()
+        url = f"/api/v1/strategies/{created['id']}"
+        try:
+            first = client.get(url)
+            etag = first.headers["etag"]
+            assert first.status_code == 200
+
+            cached = client.get(url, headers={"If-None-Match": etag})
+            assert cached.status_code == 304
+            assert cached.headers["etag"] == etag
+
+            client.patch(f"{url}/rename", json={"name": f"etag-{uuid4().hex}"})
+            renamed = client.get(url, headers={"If-None-Match": etag})
+            assert renamed.status_code == 200
+            assert renamed.headers["etag"] != etag
+        finally:
+            client.delete(url)
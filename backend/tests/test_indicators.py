@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from app.services.indicators import ema, rolling_mean, wilder_rsi
+
+
+def test_rolling_mean_matches_pandas():
+    values = np.random.default_rng(0).normal(100, 5, 50)
+    expected = pd.Series(values).rolling(window=7).mean().to_numpy()
+    np.testing.assert_allclose(rolling_mean(values, 7), expected, equal_nan=True)
+
+
+def test_rolling_mean_long_series_and_gaps_match_pandas():
+    values = 100 * np.exp(np.random.default_rng(3).normal(0, 0.01, 100_000).cumsum())
+    values[500:503] = np.nan
+    expected = pd.Series(values).rolling(window=20).mean().to_numpy()
+    np.testing.assert_allclose(rolling_mean(values, 20), expected, rtol=1e-14, atol=0, equal_nan=True)
+
+
+def test_rolling_mean_window_longer_than_series():
+    assert np.isnan(rolling_mean(np.array([1.0, 2.0]), 3)).all()
+
+
+def test_ema_matches_pandas_ewm():
+    values = np.random.default_rng(1).normal(100, 5, 200)
+    expected = pd.Series(values).ewm(span=12, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(ema(values, 12), expected)
+
+
+def test_ema_skips_missing_values_like_pandas():
+    values = np.array([1.0, 2.0, np.nan, 4.0, 5.0])
+    expected = pd.Series(values).ewm(span=3, adjust=False).mean().to_numpy()
+    np.testing.assert_allclose(ema(values, 3), expected)
+
+
+def test_wilder_rsi_matches_reference_smoothing():
+    close = np.random.default_rng(2).normal(0, 1, 120).cumsum() + 100
+    delta = pd.Series(close).diff()
+    # Wilder smoothing is an EWM with alpha = 1 / window seeded by the first simple average
+    gains = delta.clip(lower=0).to_numpy()
+    losses = (-delta.clip(upper=0)).to_numpy()
+    avg_gain, avg_loss = gains[1:15].mean(), losses[1:15].mean()
+    expected = [100 - 100 / (1 + avg_gain / avg_loss)]
+    for gain, loss in zip(gains[15:], losses[15:]):
+        avg_gain = (avg_gain * 13 + gain) / 14
+        avg_loss = (avg_loss * 13 + loss) / 14
+        expected.append(100 - 100 / (1 + avg_gain / avg_loss))
+
+    rsi = wilder_rsi(close, 14)
+    assert np.isnan(rsi[:14]).all()
+    np.testing.assert_allclose(rsi[14:], expected)
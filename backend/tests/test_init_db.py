@@ -0,0 +1,15 @@
+from sqlalchemy import inspect, text
+
+from app.db import init_db as init_db_module
+
+
+def test_init_db_drops_the_superseded_symbol_index(database, monkeypatch):
+    with database.begin() as conn:
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_backtests_symbol ON backtests (symbol)"))
+    monkeypatch.setattr(init_db_module, "_schema_ready", False)
+
+    init_db_module.init_db()
+
+    names = {index["name"] for index in inspect(database).get_indexes("backtests")}
+    assert "ix_backtests_symbol" not in names
+    assert "ix_backtests_symbol_created_at_id" in names
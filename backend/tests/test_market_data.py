@@ -0,0 +1,99 @@
+import asyncio
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from app.services import market_data
+
+
+def test_fetch_history_reuses_cached_download(monkeypatch):
+    calls = []
+
+    def fake_download(symbol, period, interval):
+        calls.append((symbol, period, interval))
+        return pd.DataFrame({"Close": [1.0, 2.0]})
+
+    monkeypatch.setattr(market_data, "_download_history", fake_download)
+    monkeypatch.setattr(market_data, "_history_cache", OrderedDict())
+
+    first = asyncio.run(market_data.fetch_history("aapl", "1mo", "1d"))
+    second = asyncio.run(market_data.fetch_history("AAPL", "1mo", "1d"))
+
+    assert calls == [("aapl", "1mo", "1d")]
+    assert second["Close"].tolist() == first["Close"].tolist()
+
+
+def test_fetch_history_evicts_least_recently_used(monkeypatch):
+    calls = []
+
+    def fake_download(symbol, period, interval):
+        calls.append(symbol)
+        return pd.DataFrame({"Close": [1.0]})
+
+    monkeypatch.setattr(market_data, "_download_history", fake_download)
+    monkeypatch.setattr(market_data, "_history_cache", OrderedDict())
+    monkeypatch.setattr(market_data.settings, "HISTORY_CACHE_MAX_ENTRIES", 2)
+
+    for symbol in ["AAA", "BBB", "AAA", "CCC", "AAA", "BBB"]:
+        asyncio.run(market_data.fetch_history(symbol, "1mo", "1d"))
+
+    assert calls == ["AAA", "BBB", "CCC", "BBB"]
+
+
+def test_fetch_history_does_not_keep_locks_for_uncached_keys(monkeypatch):
+    def fake_download(symbol, period, interval):
+        if symbol == "BOOM":
+            raise RuntimeError("download failed")
+        return pd.DataFrame()
+
+    monkeypatch.setattr(market_data, "_download_history", fake_download)
+    monkeypatch.setattr(market_data, "_history_cache", OrderedDict())
+
+    async def fetch_all():
+        symbols = [f"BAD{i}" for i in range(50)] * 2 + ["BOOM"]
+        return await asyncio.gather(
+            *(market_data.fetch_history(symbol, "1mo", "1d") for symbol in symbols), return_exceptions=True
+        )
+
+    results = asyncio.run(fetch_all())
+
+    assert isinstance(results[-1], RuntimeError)
+    assert market_data._history_locks == {}
+    assert not market_data._history_lock_users
+
+
+def test_iso_timestamps_match_isoformat_across_dst():
+    timestamps = pd.Series(pd.date_range("2024-03-08 09:30", periods=72, freq="h", tz="America/New_York"))
+
+    assert market_data.iso_timestamps(timestamps) == [ts.isoformat() for ts in timestamps]
+    assert market_data.epoch_seconds(timestamps) == [int(ts.timestamp()) for ts in timestamps]
+    assert market_data.iso_timestamps(timestamps.iloc[:0]) == []
+
+
+def test_concurrent_downloads_of_one_symbol_keep_their_own_history(monkeypatch):
+    import yfinance as yf
+
+    periods = ["1mo", "3mo", "6mo"]
+    # every download is inside history() at once, the overlap that breaks a shared Ticker
+    overlap = threading.Barrier(len(periods), timeout=5)
+
+    class FakeTicker:
+        def __init__(self, symbol):
+            self._history_metadata = None
+
+        def history(self, period, interval):
+            # like yfinance, keep per-call metadata on the instance and read it back afterwards
+            self._history_metadata = {"range": period}
+            overlap.wait()
+            return pd.DataFrame({"range": [self._history_metadata["range"]]})
+
+    monkeypatch.setattr(yf, "Ticker", FakeTicker)
+    monkeypatch.setattr(market_data, "_history_cache", OrderedDict())
+
+    async def fetch_all():
+        return await asyncio.gather(*(market_data.fetch_history("AAPL", period, "1d") for period in periods))
+
+    results = asyncio.run(fetch_all())
+
+    assert [history["range"].iloc[0] for history in results] == periods